@@ -0,0 +1,15 @@
+"""Process-wide setup for the Streamlit app.
+
+Streamlit re-executes app.py on every interaction, but a module body runs only on
+its first import, so settings that must happen once per interpreter live here.
+"""
+import os
+import warnings
+
+os.environ.setdefault('MPLBACKEND', 'Agg')  # keep matplotlib headless-friendly
+
+warnings.filterwarnings(
+    'ignore',
+    message='pkg_resources is deprecated as an API.*',
+    category=UserWarning,
+)
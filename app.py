@@ -1,20 +1,25 @@
+import _boot  # noqa: F401 - one-time env/warnings setup; must precede matplotlib imports
 import os
 import re
-os.environ.setdefault('MPLBACKEND', 'Agg')  # keep matplotlib headless-friendly
+import hashlib
 import json
+import math
 import tempfile
-import warnings
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from vertex_direct import analyze_brand_vertex
+try:  # Optional fast JSON serializer; stdlib json is the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - guard for environments without orjson
+    orjson = None  # type: ignore
 
-warnings.filterwarnings(
-    'ignore',
-    message='pkg_resources is deprecated as an API.*',
-    category=UserWarning,
-)
+try:  # Optional SIMD content hash for upload cache keys; hashlib.sha256 is the fallback
+    from blake3 import blake3  # type: ignore
+except Exception:  # pragma: no cover - guard for environments without blake3
+    blake3 = None  # type: ignore
 
 st.set_page_config(page_title='Ad Attention Analyzer', layout='wide')
 
@@ -22,6 +27,16 @@ st.title('Ad Attention Analyzer')
 st.caption('Predict attention, inspect pacing, and run a quick Vertex AI brand check.')
 
 
+def _json_dumps(obj: Any) -> str:
+    """Pretty-print ``obj`` as JSON, using orjson when it is available and can encode it."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
 def _run_local_cli(
     video_path: str,
     out_dir: str,
@@ -30,30 +45,132 @@ def _run_local_cli(
     age_group: str,
     scene_method: str,
     lam_override: Optional[str],
-) -> None:
-    import sys
-
-    args = [
-        'assess_ad',
-        '--video',
-        video_path,
-        '--out',
-        out_dir,
-        '--fps',
-        str(fps),
-        '--goal',
-        goal,
-        '--age-group',
-        age_group,
-        '--scene-method',
-        scene_method,
-    ]
+) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        'fps': float(fps),
+        'goal': goal,
+        'age_group': age_group,
+        'scene_method': scene_method,
+    }
     if lam_override and lam_override.strip():
-        args.extend(['--lambda', lam_override.strip()])
-    sys.argv = args
-    from src.assess_ad import main as cli_main
+        options['lam'] = float(lam_override.strip())
+    from src.assess_ad import analyze
+
+    return analyze(video_path, out_dir, **options)
+
+
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def _save_upload(uploaded: Any, video_path: str) -> str:
+    """Stream the upload to ``video_path`` in chunks and return its content hash.
+
+    Hashing (BLAKE3 when installed, otherwise SHA-256) happens on the chunks as
+    they are written, so the video is read once.
+    """
+    digest = blake3() if blake3 is not None else hashlib.sha256()
+    uploaded.seek(0)
+    with open(video_path, 'wb') as vid_file:
+        while True:
+            chunk = uploaded.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            vid_file.write(chunk)
+    return digest.hexdigest()
+
+
+ARTIFACT_FILES = ('overlay.mp4', 'attention_curve.png', 'editing_rhythm.png', 'pacing_score.png')
+# Streamlit's disk cache never evicts, so analysis results are cached in memory with an age limit
+ANALYSIS_CACHE_TTL = 3600
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=ANALYSIS_CACHE_TTL)
+def _run_local_analysis(
+    video_sha: str,
+    _video_path: str,
+    fps: int,
+    goal: str,
+    age_group: str,
+    scene_method: str,
+    lam_override: Optional[str],
+) -> Dict[str, Any]:
+    """Run the CLI pipeline and return the report plus the rendered artifacts as bytes.
+
+    Keyed on the upload's content hash and scoring settings; the video path is
+    excluded from the key because it lives in a per-run temp directory. Results
+    stay in memory only (bounded by entry count and age), so artifact bytes do
+    not accumulate on disk.
+    """
+    with tempfile.TemporaryDirectory() as out_dir:
+        report = _run_local_cli(
+            video_path=_video_path,
+            out_dir=out_dir,
+            fps=fps,
+            goal=goal,
+            age_group=age_group,
+            scene_method=scene_method,
+            lam_override=lam_override,
+        )
+        artifacts: Dict[str, bytes] = {}
+        with os.scandir(out_dir) as entries:
+            for entry in entries:
+                if entry.name in ARTIFACT_FILES and entry.is_file():
+                    with open(entry.path, 'rb') as artifact_file:
+                        artifacts[entry.name] = artifact_file.read()
+    return {'report': report, 'artifacts': artifacts}
+
+
+class _PartialBrandResult(Exception):
+    """Carries a Vertex result with stage failures out of the cache so it is not stored."""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get('PartialErrors'))
+        self.result = result
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=ANALYSIS_CACHE_TTL)
+def _cached_brand_analysis(
+    video_sha: str,
+    _video_path: str,
+    filename: str,
+    content_type: str,
+    project: str,
+    location: str,
+    max_seconds: float,
+    brand_name: Optional[str],
+    brand_context: Optional[str],
+) -> Dict[str, Any]:
+    from vertex_direct import analyze_brand_vertex
+
+    result = analyze_brand_vertex(
+        video_path=_video_path,
+        filename=filename,
+        content_type=content_type,
+        project=project,
+        location=location,
+        gcs_bucket=None,
+        max_seconds=max_seconds,
+        brand_name=brand_name,
+        brand_context=brand_context,
+    )
+    # analyze_brand_vertex reports stage failures in PartialErrors instead of raising;
+    # st.cache_data does not store exceptions, so a degraded result is retried next run.
+    if result.get('PartialErrors'):
+        raise _PartialBrandResult(result)
+    return result
 
-    cli_main()
+
+def _run_brand_analysis(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Cached Vertex brand analysis; results with PartialErrors are returned uncached."""
+    try:
+        return _cached_brand_analysis(*args, **kwargs)
+    except _PartialBrandResult as exc:
+        return exc.result
+
+
+def _markdown_bullets(items: List[Any]) -> str:
+    return '\n'.join(f"- {item}" for item in items)
 
 
 def _render_summary_tab(report: Dict[str, Any]) -> None:
@@ -73,22 +190,23 @@ def _render_summary_tab(report: Dict[str, Any]) -> None:
         f"Avg cuts/sec: {avg_cut:.2f}"
     )
 
+    # One markdown element per column instead of a widget per heading and bullet
     col_strengths, col_weaknesses = st.columns(2)
-    col_strengths.subheader('Strengths')
-    for item in details.get('strengths', []) or ['(none noted)']:
-        col_strengths.markdown(f"- {item}")
-    col_strengths.subheader('Key Insights')
-    col_strengths.markdown(f"**Hook:** {details.get('hook_analysis', '—')}")
-    col_strengths.markdown(f"**Pacing:** {details.get('pacing_analysis', '—')}")
-
-    col_weaknesses.subheader('Areas to Improve')
-    for item in details.get('weaknesses', []) or ['(none noted)']:
-        col_weaknesses.markdown(f"- {item}")
-    col_weaknesses.subheader('Recommendations')
-    for item in details.get('recommendations', []) or ['Keep iterating with creative tests.']:
-        col_weaknesses.markdown(f"- {item}")
-
-    json_payload = json.dumps(report, ensure_ascii=False, indent=2)
+    col_strengths.markdown(
+        '### Strengths\n'
+        + _markdown_bullets(details.get('strengths', []) or ['(none noted)'])
+        + '\n\n### Key Insights\n'
+        + f"**Hook:** {details.get('hook_analysis', '—')}\n\n"
+        + f"**Pacing:** {details.get('pacing_analysis', '—')}"
+    )
+    col_weaknesses.markdown(
+        '### Areas to Improve\n'
+        + _markdown_bullets(details.get('weaknesses', []) or ['(none noted)'])
+        + '\n\n### Recommendations\n'
+        + _markdown_bullets(details.get('recommendations', []) or ['Keep iterating with creative tests.'])
+    )
+
+    json_payload = _json_dumps(report)
     st.download_button(
         'Download report.json',
         data=json_payload.encode('utf-8'),
@@ -97,18 +215,18 @@ def _render_summary_tab(report: Dict[str, Any]) -> None:
         use_container_width=True,
     )
     with st.expander('Scorecard JSON'):
-        st.json(report)
+        # st.json takes the serialized payload as-is, so the report is encoded once
+        st.json(json_payload, expanded=True)
 
 
-def _render_visuals_tab(out_dir: str, report: Dict[str, Any]) -> None:
-    overlay_path = os.path.join(out_dir, 'overlay.mp4')
-    if os.path.exists(overlay_path):
+def _render_visuals_tab(artifacts: Dict[str, bytes], report: Dict[str, Any]) -> None:
+    overlay = artifacts.get('overlay.mp4')
+    if overlay:
         st.subheader('Heatmap Overlay')
         try:
-            st.video(overlay_path)
+            st.video(overlay, format='video/mp4')
         except Exception:
-            with open(overlay_path, 'rb') as vid_file:
-                st.download_button('Download overlay.mp4', vid_file, file_name='overlay.mp4')
+            st.download_button('Download overlay.mp4', overlay, file_name='overlay.mp4', mime='video/mp4')
     else:
         st.info('Overlay video not produced.')
 
@@ -119,10 +237,10 @@ def _render_visuals_tab(out_dir: str, report: Dict[str, Any]) -> None:
         ('Pacing Score', 'pacing_score.png', cols[2]),
     ]
     for title, filename, container in plots:
-        img_path = os.path.join(out_dir, filename)
+        image = artifacts.get(filename)
         with container:
-            if os.path.exists(img_path):
-                container.image(img_path, caption=title, use_column_width=True)
+            if image:
+                container.image(image, caption=title, use_column_width=True)
             else:
                 container.caption(f'{title}: not available')
 
@@ -133,25 +251,35 @@ def _render_visuals_tab(out_dir: str, report: Dict[str, Any]) -> None:
 
 
 def _coerce_segments(value: Any) -> List[Dict[str, Any]]:
-    if isinstance(value, list):
-        return [seg for seg in value if isinstance(seg, dict)]
-    if isinstance(value, dict) and isinstance(value.get('segments'), list):
-        return [seg for seg in value['segments'] if isinstance(seg, dict)]
-    return []
+    segments = value.get('segments') if isinstance(value, dict) else value
+    if not isinstance(segments, list):
+        return []
+    return [seg for seg in segments if isinstance(seg, dict)]
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+# Indexed by (has_start << 1) | has_end
+SEGMENT_RANGE_FORMATS = ('', '[→ {end:.1f}s]', '[{start:.1f}s]', '[{start:.1f}s → {end:.1f}s]')
 
 
 def _format_segment_range(segment: Dict[str, Any]) -> str:
-    start = segment.get('startSec')
-    end = segment.get('endSec')
-    has_start = isinstance(start, (int, float))
-    has_end = isinstance(end, (int, float))
-    if has_start and has_end:
-        return f"[{start:.1f}s → {end:.1f}s]"
-    if has_start:
-        return f"[{start:.1f}s]"
-    if has_end:
-        return f"[→ {end:.1f}s]"
-    return ''
+    start = _to_float(segment.get('startSec'))
+    end = _to_float(segment.get('endSec'))
+    fmt = SEGMENT_RANGE_FORMATS[((start is not None) << 1) | (end is not None)]
+    return fmt.format(start=start, end=end)
+
+
+def _format_segment_lines(segments: List[Dict[str, Any]]) -> str:
+    return '\n\n'.join(
+        f"{_format_segment_range(seg)} {seg.get('text', '')}".strip() for seg in segments
+    )
 
 
 SENSITIVE_TERMS = {
@@ -176,6 +304,13 @@ CTA_TERMS = {
     'get started',
 }
 
+# Compiled once per process so both term sets are found in a single scan;
+# sensitive terms need whole-word hits, CTAs match as substrings.
+HEURISTIC_TERMS_RE = re.compile(
+    r'(?P<sensitive>\b(?:' + '|'.join(re.escape(t) for t in sorted(SENSITIVE_TERMS)) + r')\b)'
+    r'|(?P<cta>' + '|'.join(re.escape(t) for t in sorted(CTA_TERMS)) + r')'
+)
+
 
 def _dedupe_strings(values: Any) -> List[str]:
     if not isinstance(values, list):
@@ -198,8 +333,11 @@ def _evaluate_transcript_heuristics(
     transcript: List[Dict[str, Any]], text_extraction: Dict[str, Any]
 ) -> Dict[str, Any]:
     combined_text = ' '.join(str(seg.get('text', '')) for seg in transcript).lower()
-    sensitive_hits = sorted({term for term in SENSITIVE_TERMS if re.search(rf"\\b{re.escape(term)}\\b", combined_text)})
-    cta_hits = sorted({term for term in CTA_TERMS if term in combined_text})
+    hits: Dict[str, set] = {'sensitive': set(), 'cta': set()}
+    for match in HEURISTIC_TERMS_RE.finditer(combined_text):
+        hits[match.lastgroup].add(match.group())
+    sensitive_hits = sorted(hits['sensitive'])
+    cta_hits = sorted(hits['cta'])
 
     brand_mentions: List[str] = []
     mention_count: Optional[int] = None
@@ -210,8 +348,8 @@ def _evaluate_transcript_heuristics(
             mention_count = len(brand_mentions)
             brand_mentions = brand_mentions[:5]
         else:
-            raw_count = text_extraction.get('brandMentionCount')
-            if isinstance(raw_count, (int, float)):
+            raw_count = _to_float(text_extraction.get('brandMentionCount'))
+            if raw_count is not None:
                 mention_count = int(raw_count)
         raw_nonsense = text_extraction.get('nonsenseWords')
         if isinstance(raw_nonsense, list):
@@ -239,17 +377,17 @@ def _render_brand_tab(brand_result: Optional[Dict[str, Any]], brand_err: Optiona
         st.write(brand_result['description'])
 
     cols = st.columns(3)
-    logo = (brand_result.get('logoAnalysis') or {}) if isinstance(brand_result, dict) else {}
-    tc = (brand_result.get('textCoherency') or {}) if isinstance(brand_result, dict) else {}
-    text_extraction = (brand_result.get('textExtraction') or {}) if isinstance(brand_result, dict) else {}
+    logo = brand_result.get('logoAnalysis') or {}
+    tc = brand_result.get('textCoherency') or {}
+    text_extraction = brand_result.get('textExtraction') or {}
 
     with cols[0]:
         st.metric('Logo consistent', str(logo.get('isConsistent', 'unknown')))
         if logo.get('identifiedLogo'):
             st.caption(f"Identified: {logo['identifiedLogo']}")
     with cols[1]:
-        score = tc.get('score')
-        if isinstance(score, (int, float)):
+        score = _to_float(tc.get('score'))
+        if score is not None:
             st.metric('Text coherency', f"{score:.2f}")
         if tc.get('analysis'):
             st.caption(tc['analysis'])
@@ -263,8 +401,10 @@ def _render_brand_tab(brand_result: Optional[Dict[str, Any]], brand_err: Optiona
                 brand_count = len(deduped)
                 if deduped:
                     mentions_caption = ', '.join(deduped[:4])
-            elif isinstance(raw_mentions, (int, float)):
-                brand_count = int(raw_mentions)
+            else:
+                mention_total = _to_float(raw_mentions)
+                if mention_total is not None:
+                    brand_count = int(mention_total)
         st.metric('Brand mentions', str(brand_count if brand_count is not None else 'n/a'))
         extra_bits: List[str] = []
         if mentions_caption:
@@ -277,24 +417,17 @@ def _render_brand_tab(brand_result: Optional[Dict[str, Any]], brand_err: Optiona
             deduped_topics = _dedupe_strings(topics)
             if deduped_topics:
                 extra_bits.append('Topics: ' + ', '.join(deduped_topics[:4]))
-        for line in extra_bits:
-            st.caption(line)
+        if extra_bits:
+            st.caption('  \n'.join(extra_bits))
 
+    # Each section (heading plus first five segments) goes out as one markdown element
     transcript = _coerce_segments(brand_result.get('transcript'))
     if transcript:
-        st.markdown('#### Transcript Highlights')
-        for seg in transcript[:5]:
-            prefix = _format_segment_range(seg)
-            text = seg.get('text', '')
-            st.write(f"{prefix} {text}".strip())
+        st.markdown('#### Transcript Highlights\n\n' + _format_segment_lines(transcript[:5]))
 
     visual_text = _coerce_segments(brand_result.get('visualText'))
     if visual_text:
-        st.markdown('#### On-screen Text')
-        for seg in visual_text[:5]:
-            prefix = _format_segment_range(seg)
-            txt = seg.get('text', '')
-            st.write(f"{prefix} {txt}".strip())
+        st.markdown('#### On-screen Text\n\n' + _format_segment_lines(visual_text[:5]))
 
     heuristics = _evaluate_transcript_heuristics(transcript, text_extraction)
     st.markdown('#### Brand & Safety Heuristics')
@@ -326,11 +459,11 @@ def _render_brand_tab(brand_result: Optional[Dict[str, Any]], brand_err: Optiona
     else:
         st.caption('No obvious sensitive language detected in transcript sample.')
 
-    partial_errors = brand_result.get('PartialErrors') if isinstance(brand_result, dict) else None
+    partial_errors = brand_result.get('PartialErrors')
     if partial_errors:
         st.warning(f"Partial errors during Vertex calls: {partial_errors}")
 
-    meta = brand_result.get('AnalysisMeta') if isinstance(brand_result, dict) else None
+    meta = brand_result.get('AnalysisMeta')
     if meta:
         size_mb = float(meta.get('compressedBytes', 0.0)) / 1_048_576.0
         st.caption(
@@ -338,7 +471,43 @@ def _render_brand_tab(brand_result: Optional[Dict[str, Any]], brand_err: Optiona
         )
 
     with st.expander('Brand JSON result'):
-        st.json(brand_result)
+        st.json(_json_dumps(brand_result), expanded=True)
+
+
+@st.fragment
+def _render_results(
+    local_result: Dict[str, Any],
+    brand_future: Optional[Future] = None,
+    brand_result: Optional[Dict[str, Any]] = None,
+    brand_err: Optional[str] = None,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Render the result tabs and return the resolved Vertex result and error.
+
+    When ``brand_future`` is given, the local tabs render first and only the Brand
+    tab waits on it. Runs as a fragment, so widgets inside the results (e.g. the
+    report download) rerun only this block rather than the whole script.
+    """
+    report = local_result['report']
+    summary_tab, visuals_tab, brand_tab = st.tabs(
+        ['Score Summary', 'Visual Outputs', 'Brand']
+    )
+    with summary_tab:
+        _render_summary_tab(report)
+    with visuals_tab:
+        _render_visuals_tab(local_result['artifacts'], report)
+    with brand_tab:
+        if brand_future is not None:
+            with st.spinner('Calling Vertex AI...'):
+                try:
+                    brand_result = brand_future.result()
+                except Exception as exc:  # pragma: no cover - surfaced to user
+                    brand_err = str(exc)
+        _render_brand_tab(brand_result, brand_err)
+    return brand_result, brand_err
+
+
+GOAL_OPTIONS = ('hook', 'explainer', 'calm_brand')
+AGE_GROUP_OPTIONS = ('general', 'gen_z', 'millennial', 'gen_x', 'boomer', 'children')
 
 
 with st.form('analysis_form'):
@@ -352,11 +521,11 @@ with st.form('analysis_form'):
     col_opts = st.columns(2)
     with col_opts[0]:
         fps = st.slider('Sampling FPS', 1, 6, 2)
-        goal = st.selectbox('Creative goal', ['hook', 'explainer', 'calm_brand'], index=0)
+        goal = st.selectbox('Creative goal', GOAL_OPTIONS, index=0)
     with col_opts[1]:
         age_group = st.selectbox(
             'Target age group',
-            ['general', 'gen_z', 'millennial', 'gen_x', 'boomer', 'children'],
+            AGE_GROUP_OPTIONS,
             index=0,
         )
 
@@ -374,56 +543,67 @@ if submitted:
     if not uploaded:
         st.error('Upload an MP4 to analyze.')
     else:
-        with tempfile.TemporaryDirectory() as tmpd:
-            video_path = os.path.join(tmpd, uploaded.name or 'video.mp4')
-            video_bytes = uploaded.getvalue()
-            with open(video_path, 'wb') as vid_file:
-                vid_file.write(video_bytes)
-
-            out_dir = os.path.join(tmpd, 'out')
-            os.makedirs(out_dir, exist_ok=True)
-
-            with st.spinner('Running attention + pacing analysis...'):
-                _run_local_cli(
-                    video_path=video_path,
-                    out_dir=out_dir,
-                    fps=fps,
-                    goal=goal,
-                    age_group=age_group,
-                    scene_method='hist',
-                    lam_override=None,
-                )
-
-            report_path = os.path.join(out_dir, 'report.json')
-            report = json.load(open(report_path, 'r', encoding='utf-8'))
-
-            brand_result: Optional[Dict[str, Any]] = None
-            brand_err: Optional[str] = None
-            if vertex_project:
-                with st.spinner('Calling Vertex AI...'):
-                    try:
-                        brand_result = analyze_brand_vertex(
-                            video_bytes=video_bytes,
+        run_key = (
+            uploaded.file_id, fps, goal, age_group,
+            vertex_project, vertex_location, brand_name, brand_context,
+        )
+        last_analysis = st.session_state.get('last_analysis')
+        if (
+            last_analysis is not None
+            and not last_analysis['brand_err']
+            and not (last_analysis.get('brand_result') or {}).get('PartialErrors')
+            and st.session_state.get('last_run_key') == run_key
+        ):
+            # Identical resubmission (e.g. a double click): redraw instead of re-running.
+            # A failed or partial brand result is retried rather than redrawn.
+            _render_results(**last_analysis)
+        else:
+            with tempfile.TemporaryDirectory() as tmpd:
+                video_path = os.path.join(tmpd, uploaded.name or 'video.mp4')
+                video_sha = _save_upload(uploaded, video_path)
+
+                # Vertex is network-bound, so run it on a worker thread while the
+                # CPU-bound local pipeline runs on the script thread.
+                with ThreadPoolExecutor(
+                    max_workers=1,
+                    initializer=add_script_run_ctx,
+                    initargs=(None, get_script_run_ctx()),
+                ) as executor:
+                    brand_future: Optional[Future] = None
+                    if vertex_project:
+                        brand_future = executor.submit(
+                            _run_brand_analysis,
+                            video_sha,
+                            video_path,
                             filename=uploaded.name or 'video.mp4',
                             content_type=uploaded.type or 'video/mp4',
                             project=vertex_project,
                             location=vertex_location,
-                            gcs_bucket=None,
                             max_seconds=60.0,
                             brand_name=brand_name.strip() or None,
                             brand_context=brand_context.strip() or None,
                         )
-                    except Exception as exc:  # pragma: no cover - surfaced to user
-                        brand_err = str(exc)
-
-            summary_tab, visuals_tab, brand_tab = st.tabs(
-                ['Score Summary', 'Visual Outputs', 'Brand']
-            )
-            with summary_tab:
-                _render_summary_tab(report)
-            with visuals_tab:
-                _render_visuals_tab(out_dir, report)
-            with brand_tab:
-                _render_brand_tab(brand_result, brand_err)
+
+                    with st.spinner('Running attention + pacing analysis...'):
+                        local_result = _run_local_analysis(
+                            video_sha,
+                            video_path,
+                            fps=fps,
+                            goal=goal,
+                            age_group=age_group,
+                            scene_method='hist',
+                            lam_override=None,
+                        )
+
+                    brand_result, brand_err = _render_results(local_result, brand_future=brand_future)
+                # Keep the last results so reruns (e.g. a download click) redraw them without re-analysis
+                st.session_state['last_analysis'] = {
+                    'local_result': local_result,
+                    'brand_result': brand_result,
+                    'brand_err': brand_err,
+                }
+                st.session_state['last_run_key'] = run_key
+elif 'last_analysis' in st.session_state:
+    _render_results(**st.session_state['last_analysis'])
 else:
     st.info('Upload an MP4 and click "Run analysis" to get started.')
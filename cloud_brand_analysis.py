@@ -1,26 +1,55 @@
 import os
 import requests
-from typing import Optional, Tuple, Any, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Tuple, Any, Dict, BinaryIO, Union
+
+try:  # Optional fast JSON parser; stdlib json (via requests) is the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - guard for environments without orjson
+    orjson = None  # type: ignore
+
+
+def _response_json(r: requests.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
 
 
 class CloudBrandAnalyzer:
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 60):
+    def __init__(self, base_url: Optional[str] = None, timeout: int = 60,
+                 session: Optional[requests.Session] = None, connect_timeout: float = 10.0):
         self.base_url = base_url or os.getenv("ADVALUATE_BACKEND_URL", "").strip()
-        self.timeout = timeout
+        # (connect, read): fail fast on unreachable hosts, allow slow reads and uploads
+        self.timeout = (connect_timeout, timeout)
+        # One pooled session so sign/upload/analyze reuse keep-alive connections
+        self.session = session or self._build_session()
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        session = requests.Session()
+        # Only GET (sign-upload) is retried: the PUT body streams from a file and
+        # cannot be replayed, and analyze POSTs are not idempotent.
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset({"GET"}))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def is_configured(self) -> bool:
         return bool(self.base_url)
 
     def _sign_upload(self, filename: str, content_type: str) -> Tuple[str, str]:
         url = f"{self.base_url}/api/sign-upload"
-        r = requests.get(url, params={"filename": filename, "contentType": content_type}, timeout=self.timeout)
+        r = self.session.get(url, params={"filename": filename, "contentType": content_type}, timeout=self.timeout)
         r.raise_for_status()
-        data = r.json()
+        data = _response_json(r)
         return data["uploadUrl"], data["gcsUri"]
 
-    def _upload_bytes(self, upload_url: str, data: bytes, content_type: str) -> None:
+    def _upload_bytes(self, upload_url: str, data: Union[bytes, BinaryIO], content_type: str) -> None:
         headers = {"Content-Type": content_type or "video/mp4"}
-        r = requests.put(upload_url, data=data, headers=headers, timeout=self.timeout)
+        r = self.session.put(upload_url, data=data, headers=headers, timeout=self.timeout)
         r.raise_for_status()
 
     def _analyze(self, gcs_uri: str, brand_name: Optional[str], brand_mission: Optional[str]) -> Dict[str, Any]:
@@ -30,31 +59,41 @@ class CloudBrandAnalyzer:
             "brandName": brand_name or None,
             "brandMission": brand_mission or None,
         }
-        r = requests.post(url, json=payload, timeout=self.timeout)
+        r = self.session.post(url, json=payload, timeout=self.timeout)
         if r.ok:
-            return r.json()
+            return _response_json(r)
         # Try to surface helpful server details
         detail = None
         try:
-            detail = r.json()
+            detail = _response_json(r)
         except Exception:
             detail = r.text
         msg = f"Analyze request failed ({r.status_code}). Details: {detail}"
         raise RuntimeError(msg)
 
     def run(self,
-            video_bytes: bytes,
+            video_bytes: Optional[bytes] = None,
             filename: str = "video.mp4",
             content_type: str = "video/mp4",
             brand_name: Optional[str] = None,
-            brand_mission: Optional[str] = None) -> Dict[str, Any]:
+            brand_mission: Optional[str] = None,
+            video_path: Optional[str] = None) -> Dict[str, Any]:
         """Uploads the video to the backend using signed URL and triggers analysis.
 
+        Pass ``video_path`` instead of ``video_bytes`` to stream the upload from
+        disk rather than holding the whole file in memory.
+
         Returns the JSON result produced by the backend.
         """
         if not self.is_configured():
             raise RuntimeError("CloudBrandAnalyzer not configured. Set ADVALUATE_BACKEND_URL or pass base_url.")
+        if video_bytes is None and not video_path:
+            raise ValueError("Provide either video_bytes or video_path.")
 
         upload_url, gcs_uri = self._sign_upload(filename, content_type)
-        self._upload_bytes(upload_url, video_bytes, content_type)
+        if video_path:
+            with open(video_path, "rb") as f:
+                self._upload_bytes(upload_url, f, content_type)
+        else:
+            self._upload_bytes(upload_url, video_bytes, content_type)
         return self._analyze(gcs_uri, brand_name, brand_mission)
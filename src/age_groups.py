@@ -2,6 +2,7 @@
 Age group configurations for ad attention scoring.
 Different age groups have different attention patterns and preferences.
 """
+from dataclasses import dataclass
 
 AGE_GROUPS = {
     "gen_z": {
@@ -150,6 +151,48 @@ AGE_GROUPS = {
     }
 }
 
+@dataclass(frozen=True)
+class AgeScoring:
+    """Flattened scoring weights and time decay for one age group."""
+    w_sal: float
+    w_motion: float
+    w_clip: float
+    w_pace: float
+    td_start: float
+    td_end: float
+
+# Built once at import so scoring reads attributes instead of nested dict lookups
+_AGE_SCORING = {
+    key: AgeScoring(
+        w_sal=cfg["weights"]["saliency"],
+        w_motion=cfg["weights"]["motion"],
+        w_clip=cfg["weights"]["clip"],
+        w_pace=cfg["weights"]["pacing"],
+        td_start=cfg["time_decay"]["start"],
+        td_end=cfg["time_decay"]["end"],
+    )
+    for key, cfg in AGE_GROUPS.items()
+}
+
+# Flat (age_group, goal) lookup; unknown pairs take the fallback path below
+_PACING = {
+    (key, goal): prefs
+    for key, cfg in AGE_GROUPS.items()
+    for goal, prefs in cfg["pacing_preferences"].items()
+}
+
+def get_age_scoring(age_group="general"):
+    """
+    Get the precomputed scoring weights and time decay for an age group.
+
+    Args:
+        age_group: Age group key (falls back to general)
+
+    Returns:
+        AgeScoring instance
+    """
+    return _AGE_SCORING.get(age_group, _AGE_SCORING["general"])
+
 def get_age_group_config(age_group="general"):
     """
     Get configuration for a specific age group.
@@ -173,6 +216,9 @@ def get_pacing_for_age_group(age_group, goal):
     Returns:
         dict with f_star and lambda
     """
-    config = get_age_group_config(age_group)
-    return config["pacing_preferences"].get(goal, config["pacing_preferences"]["hook"])
+    prefs = _PACING.get((age_group, goal))
+    if prefs is None:
+        config = get_age_group_config(age_group)
+        prefs = config["pacing_preferences"].get(goal, config["pacing_preferences"]["hook"])
+    return prefs
 
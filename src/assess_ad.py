@@ -1,11 +1,12 @@
 import os, json, argparse
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
 from .frame_extractor import read_frames
-from .saliency import spectral_residual_saliency
+from .saliency import spectral_residual_saliency_batch
 from .motion import motion_series
 from .clip_scorer import score_frames_with_prompts
-from .attention_score import saliency_concentration, combine_scores
+from .attention_score import saliency_concentration_batch, combine_scores
 from .overlay import write_overlay_video
 from .scene_change import compute_deltas, cut_rate_series, pacing_score_series
 from .score_interpreter import interpret_score
@@ -18,11 +19,17 @@ GOAL_PRESETS = {
     "calm_brand": {"f_star": 0.2, "lambda": 1.0}
 }
 
-def main():
+@lru_cache(maxsize=1)
+def _build_parser():
+    # Built once per process; parse_args does not mutate the parser, so in-process callers can reuse it
     ap = argparse.ArgumentParser(description='Ad Attention Analyzer (+ pacing)')
     ap.add_argument('--video', required=True, help='path to mp4')
     ap.add_argument('--out', default='./out', help='output directory')
     ap.add_argument('--fps', type=float, default=2.0, help='sampling fps')
+    ap.add_argument('--decode-workers', type=int, default=1,
+                    help='decode the video in this many parallel segments (1 = sequential)')
+    ap.add_argument('--saliency-workers', type=int, default=1,
+                    help='compute saliency maps on this many threads (1 = sequential)')
     ap.add_argument('--use-clip', action='store_true', help='enable CLIP scoring')
     ap.add_argument('--goal', choices=list(GOAL_PRESETS.keys()), default='hook', help='goal preset')
     ap.add_argument('--lambda', dest='lam', type=float, default=None, help='override lambda')
@@ -34,87 +41,67 @@ def main():
     ap.add_argument('--brand-terms', default=None, help='comma-separated brand keywords to expect in on-screen text')
     ap.add_argument('--ocr-text', action='store_true', help='run OCR-based message clarity checks (requires easyocr)')
     ap.add_argument('--logo-threshold', type=float, default=0.6, help='confidence threshold for logo detection (0-1)')
-    args = ap.parse_args()
+    return ap
+
+def _save_plot(path, x, series, title, ylabel, hline=None, legend=False):
+    # Deferred so importing this module (or the app) does not pay matplotlib's import cost
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(8,3))
+    ax = fig.add_subplot()
+    for y, label in series:
+        ax.plot(x, y, label=label)
+    if hline is not None:
+        ax.axhline(hline[0], ls='--', label=hline[1])
+    ax.set_xlabel('Time (s)'); ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    if legend:
+        ax.legend()
+    ax.grid(True); fig.tight_layout()
+    fig.savefig(path, dpi=150)
+
+def analyze(video, out='./out', **options):
+    """Run the analysis in-process and return the report dict.
+
+    ``options`` take the CLI flags' destination names (fps, goal, age_group,
+    scene_method, lam, use_clip, ...); anything omitted uses the CLI default.
+    """
+    ap = _build_parser()
+    args = ap.parse_args(['--video', video, '--out', out])
+    unknown = set(options) - set(vars(args))
+    if unknown:
+        raise TypeError(f'Unknown analysis options: {sorted(unknown)}')
+    # Apply the flags' own type/choices checks so bad values fail here, not mid-pipeline
+    actions = {a.dest: a for a in ap._actions}
+    for dest, value in options.items():
+        action = actions[dest]
+        if value is not None and action.type is not None:
+            value = action.type(value)
+        if action.choices is not None and value not in action.choices:
+            raise ValueError(f'Invalid {dest}: {value!r} (choose from {sorted(action.choices)})')
+        setattr(args, dest, value)
+    return _run(args)
+
+def main(argv=None):
+    report = _run(_build_parser().parse_args(argv))
+    print(json.dumps(report, indent=2))
+    return report
+
+def _run(args):
 
     os.makedirs(args.out, exist_ok=True)
-    frames, times, native_fps = read_frames(args.video, fps=args.fps)
+    frames, times, native_fps = read_frames(args.video, fps=args.fps, workers=args.decode_workers)
     if not frames:
         raise SystemExit('No frames extracted.')
-    frame_times = list(times)
-
-    sal_maps, sal_scores = [], []
-    for f in frames:
-        sm = spectral_residual_saliency(f)
-        sal_maps.append(sm)
-        sal_scores.append(saliency_concentration(sm))
-
-    mot = motion_series(frames)
-
-    clip_series = None
-    clip_delta = 0.0
-    if args.use_clip:
-        clip_series, clip_delta = score_frames_with_prompts(frames)
-
-    deltas = compute_deltas(frames, method=args.scene_method)
-    cut_rate = cut_rate_series(deltas, fps=args.fps, window_s=2.0, thresh='zscore')
-    cut_rate_series_full = np.concatenate([[cut_rate[0] if len(cut_rate)>0 else 0.0], cut_rate]).tolist()
-
-    # Get pacing preferences based on age group and goal
-    age_pacing = get_pacing_for_age_group(args.age_group, args.goal)
-    preset = GOAL_PRESETS[args.goal]
-    # Use age group pacing preferences by default
-    lam = args.lam if args.lam is not None else age_pacing['lambda']
-    f_star = age_pacing['f_star']
-    pacing_series = pacing_score_series(np.array(cut_rate_series_full, dtype='float32'), f_star=f_star, lam=lam).tolist()
-
-    curve, overall = combine_scores(sal_scores, mot, clip_series, clip_delta, pacing_series=pacing_series, w_pace=0.2, age_group=args.age_group)
-
-    arr = np.array(curve)
-    peaks_idx = np.argsort(arr)[-3:][::-1].tolist()
-    times = times[:len(curve)]
-    key_moments = [{'time': float(times[i]), 'score': float(arr[i])} for i in peaks_idx]
-
-    # Plots
-    plt.figure(figsize=(8,3))
-    plt.plot(times, curve, label='Attention')
-    plt.xlabel('Time (s)'); plt.ylabel('Score (0..1)')
-    plt.title('Predicted Attention Curve')
-    plt.grid(True); plt.tight_layout()
-    curve_path = os.path.join(args.out, 'attention_curve.png')
-    plt.savefig(curve_path, dpi=150); plt.close()
-
-    plt.figure(figsize=(8,3))
-    tr = times[:len(cut_rate_series_full)]
-    plt.plot(tr, cut_rate_series_full, label='Cut rate (cuts/sec)')
-    plt.axhline(f_star, ls='--', label=f'Goal f*={f_star}')
-    plt.xlabel('Time (s)'); plt.ylabel('Cuts/sec')
-    plt.title('Editing Rhythm')
-    plt.legend(); plt.grid(True); plt.tight_layout()
-    rhythm_path = os.path.join(args.out, 'editing_rhythm.png')
-    plt.savefig(rhythm_path, dpi=150); plt.close()
-
-    plt.figure(figsize=(8,3))
-    plt.plot(tr, pacing_series[:len(tr)], label='Pacing score')
-    plt.xlabel('Time (s)'); plt.ylabel('Score (0..1)')
-    plt.title('Goal-Adjusted Pacing Score')
-    plt.grid(True); plt.tight_layout()
-    pacing_path = os.path.join(args.out, 'pacing_score.png')
-    plt.savefig(pacing_path, dpi=150); plt.close()
-
-    overlay_path = os.path.join(args.out, 'overlay.mp4')
-    write_overlay_video(frames, sal_maps, overlay_path, fps=max(2, int(args.fps)), deltas=deltas)
-
-    first5s = float(np.mean(curve[:min(5, len(curve))]))
-    avg_cut = float(np.mean(cut_rate)) if len(cut_rate)>0 else 0.0
-    
-    # Generate score interpretation with age group
-    interpretation = interpret_score(overall, first5s, avg_cut, args.goal, f_star, age_group=args.age_group)
 
+    # Brand checks (logo, palette, OCR) only need the sampled frames,
+    # so run them on a worker while the attention pipeline below proceeds.
     brand_palette = parse_hex_palette(args.brand_colors)
     brand_terms = [t.strip() for t in (args.brand_terms or '').split(',') if t.strip()]
-    brand_eval = evaluate_brand_consistency(
+    brand_executor = ThreadPoolExecutor(max_workers=1)
+    brand_future = brand_executor.submit(
+        evaluate_brand_consistency,
         frames=frames,
-        times=frame_times,
+        times=times,
         video_path=args.video,
         brand_logo_path=args.brand_logo,
         brand_colors=brand_palette,
@@ -122,6 +109,77 @@ def main():
         run_ocr=args.ocr_text or bool(brand_terms),
         logo_threshold=float(args.logo_threshold),
     )
+    brand_executor.shutdown(wait=False)
+
+    try:
+        sal_maps = spectral_residual_saliency_batch(frames, workers=args.saliency_workers)
+        sal_scores = saliency_concentration_batch(sal_maps)
+
+        mot = motion_series(frames)
+
+        clip_series = None
+        clip_delta = 0.0
+        if args.use_clip:
+            clip_series, clip_delta = score_frames_with_prompts(frames)
+
+        deltas = compute_deltas(frames, method=args.scene_method)
+        cut_rate = cut_rate_series(deltas, fps=args.fps, window_s=2.0, thresh='zscore')
+        cut_rate_series_full = np.concatenate([[cut_rate[0] if len(cut_rate)>0 else 0.0], cut_rate]).astype('float32', copy=False)
+
+        # Get pacing preferences based on age group and goal
+        age_pacing = get_pacing_for_age_group(args.age_group, args.goal)
+        preset = GOAL_PRESETS[args.goal]
+        # Use age group pacing preferences by default
+        lam = args.lam if args.lam is not None else age_pacing['lambda']
+        f_star = age_pacing['f_star']
+        pacing_series = pacing_score_series(cut_rate_series_full, f_star=f_star, lam=lam)
+
+        curve, overall = combine_scores(sal_scores, mot, clip_series, clip_delta, pacing_series=pacing_series, w_pace=0.2, age_group=args.age_group)
+
+        arr = np.array(curve)
+        # Partial selection of the top 3, then order just those
+        k = min(3, len(arr))
+        top = np.argpartition(arr, -k)[-k:]
+        peaks_idx = top[np.argsort(arr[top])[::-1]].tolist()
+        times = times[:len(curve)]
+        key_moments = [{'time': float(times[i]), 'score': float(arr[i])} for i in peaks_idx]
+
+        # Plots: standalone Agg figures (no pyplot global state), so the three PNGs
+        # render on worker threads while the overlay video is written here.
+        curve_path = os.path.join(args.out, 'attention_curve.png')
+        rhythm_path = os.path.join(args.out, 'editing_rhythm.png')
+        pacing_path = os.path.join(args.out, 'pacing_score.png')
+        tr = times[:len(cut_rate_series_full)]
+        with ThreadPoolExecutor(max_workers=3) as plot_executor:
+            plot_futures = [
+                plot_executor.submit(_save_plot, curve_path, times, [(curve, 'Attention')],
+                                     'Predicted Attention Curve', 'Score (0..1)'),
+                plot_executor.submit(_save_plot, rhythm_path, tr, [(cut_rate_series_full, 'Cut rate (cuts/sec)')],
+                                     'Editing Rhythm', 'Cuts/sec', hline=(f_star, f'Goal f*={f_star}'), legend=True),
+                plot_executor.submit(_save_plot, pacing_path, tr, [(pacing_series[:len(tr)], 'Pacing score')],
+                                     'Goal-Adjusted Pacing Score', 'Score (0..1)'),
+            ]
+
+            overlay_path = os.path.join(args.out, 'overlay.mp4')
+            write_overlay_video(frames, sal_maps, overlay_path, fps=max(2, int(args.fps)), deltas=deltas)
+            for fut in plot_futures:
+                fut.result()
+
+        first5s = float(np.mean(curve[:min(5, len(curve))]))
+        avg_cut = float(np.mean(cut_rate)) if len(cut_rate)>0 else 0.0
+    
+        # Generate score interpretation with age group
+        interpretation = interpret_score(overall, first5s, avg_cut, args.goal, f_star, age_group=args.age_group)
+
+        brand_eval = brand_future.result()
+    finally:
+        # On an early failure don't leave the brand/OCR job running past this call:
+        # drop it if it hasn't started, otherwise wait for it and discard its outcome.
+        if not brand_future.cancel():
+            try:
+                brand_future.result()
+            except Exception:
+                pass
 
     report = {
         'Goal': args.goal,
@@ -153,7 +211,7 @@ def main():
     with open(os.path.join(args.out, 'report.json'), 'w', encoding='utf-8') as f:
         json.dump(report, f, ensure_ascii=False, indent=2)
 
-    print(json.dumps(report, indent=2))
+    return report
 
 if __name__ == '__main__':
     main()
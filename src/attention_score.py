@@ -1,18 +1,46 @@
+from functools import lru_cache
+
 import numpy as np
 
+@lru_cache(maxsize=16)
+def _center_gauss(h, w):
+    # Flattened float32 center-bias kernel; frames in a video share one shape, so this is built once
+    yy, xx = np.mgrid[0:h,0:w]
+    cx, cy = w/2, h/2
+    sigma = min(w,h)/6
+    gauss = np.exp(-(((xx-cx)**2 + (yy-cy)**2)/(2*sigma**2))).astype(np.float32).ravel()
+    gauss.setflags(write=False)
+    return gauss
+
+@lru_cache(maxsize=64)
+def _time_decay(n, start, end):
+    # Read-only float32 ramp shared by every curve of the same length and age group
+    ramp = np.linspace(start, end, n, dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
 def saliency_concentration(sal_map, center_bias=True):
     h, w = sal_map.shape
     total = sal_map.sum() + 1e-6
     if center_bias:
-        yy, xx = np.mgrid[0:h,0:w]
-        cx, cy = w/2, h/2
-        sigma = min(w,h)/6
-        gauss = np.exp(-(((xx-cx)**2 + (yy-cy)**2)/(2*sigma**2)))
-        score = float((sal_map * gauss).sum() / total)
+        flat = sal_map.ravel().astype(np.float32, copy=False)
+        score = float(flat @ _center_gauss(h, w) / total)
     else:
         score = float(np.percentile(sal_map, 95))
     return max(0.0, min(1.0, score))
 
+def saliency_concentration_batch(sal_maps, center_bias=True):
+    """Concentration score per map; an (N, H, W) stack is scored in one vectorized pass."""
+    if not isinstance(sal_maps, np.ndarray) or sal_maps.ndim != 3 or not len(sal_maps):
+        return np.array([saliency_concentration(sm, center_bias=center_bias) for sm in sal_maps], dtype=np.float32)
+    n, h, w = sal_maps.shape
+    flat = sal_maps.reshape(n, -1).astype(np.float32, copy=False)
+    if center_bias:
+        scores = (flat @ _center_gauss(h, w)) / (flat.sum(axis=1) + 1e-6)
+    else:
+        scores = np.percentile(flat, 95, axis=1)
+    return np.clip(scores, 0.0, 1.0).astype(np.float32, copy=False)
+
 def combine_scores(sal_series, motion_series, clip_series=None, clip_delta=0.0,
                    w_sal=0.5, w_motion=0.25, w_clip=0.15, pacing_series=None, w_pace=0.1,
                    age_group=None):
@@ -36,14 +64,14 @@ def combine_scores(sal_series, motion_series, clip_series=None, clip_delta=0.0,
     """
     # Import age group config if age_group is provided
     if age_group is not None:
-        from .age_groups import get_age_group_config
-        age_config = get_age_group_config(age_group)
-        w_sal = age_config["weights"]["saliency"]
-        w_motion = age_config["weights"]["motion"]
-        w_clip = age_config["weights"]["clip"]
-        w_pace = age_config["weights"]["pacing"]
-        time_decay_start = age_config["time_decay"]["start"]
-        time_decay_end = age_config["time_decay"]["end"]
+        from .age_groups import get_age_scoring
+        scoring = get_age_scoring(age_group)
+        w_sal = scoring.w_sal
+        w_motion = scoring.w_motion
+        w_clip = scoring.w_clip
+        w_pace = scoring.w_pace
+        time_decay_start = scoring.td_start
+        time_decay_end = scoring.td_end
     else:
         time_decay_start = 1.2
         time_decay_end = 1.0
@@ -61,14 +89,17 @@ def combine_scores(sal_series, motion_series, clip_series=None, clip_delta=0.0,
     else:
         P = np.array(pacing_series, dtype='float32')
 
-    if S.max() > 0: S = S / (S.max()+1e-6)
-    if M.max() > 0: M = M / (M.max()+1e-6)
-    if C.max() > 0: C = C / (C.max()+1e-6)
-    if P.max() > 0: P = np.clip(P, 0, 1)
+    # Series are non-negative, so the 1e-6 floor already covers all-zero input
+    np.multiply(S, np.float32(1.0/(float(S.max())+1e-6)), out=S)
+    np.multiply(M, np.float32(1.0/(float(M.max())+1e-6)), out=M)
+    np.multiply(C, np.float32(1.0/(float(C.max())+1e-6)), out=C)
+    np.clip(P, 0, 1, out=P)
 
     n = len(S)
-    weights_time = np.linspace(time_decay_start, time_decay_end, n)
-    curve = (w_sal*S + w_motion*M + w_clip*C + w_pace*P) * weights_time
-    curve = np.clip(curve, 0, 1)
+    # One (4,) @ (4,N) product instead of four scaled temporaries and their sum
+    w = np.array([w_sal, w_motion, w_clip, w_pace], dtype=np.float32)
+    curve = w @ np.stack([S, M, C, P])
+    curve *= _time_decay(n, time_decay_start, time_decay_end)
+    np.clip(curve, 0, 1, out=curve)
     overall = float(curve[:min(5, n)].mean()*0.6 + curve.mean()*0.4)
     return curve.tolist(), overall
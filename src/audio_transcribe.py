@@ -1,6 +1,12 @@
 import os
-import tempfile
-from typing import Any, Dict, List, Optional
+import subprocess
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:  # annotation only; numpy is imported where audio is decoded
+    import numpy as np
+
+WHISPER_SAMPLE_RATE = 16000
 
 
 def _ensure_ffmpeg_in_path() -> None:
@@ -14,53 +20,56 @@ def _ensure_ffmpeg_in_path() -> None:
         bin_dir = os.path.dirname(ffmpeg_path)
         os.environ["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
     except Exception:
-        # If we can't ensure, whisper/moviepy may still work if system ffmpeg exists
+        # If we can't ensure, decoding may still work if system ffmpeg exists
         pass
 
 
+def _decode_audio(video_path: str, max_seconds: Optional[float]) -> "np.ndarray":
+    """Decode the audio track straight to 16 kHz mono float32 PCM, the format Whisper expects."""
+    import numpy as np
+    cmd = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+    if max_seconds is not None:
+        cmd += ["-t", str(max_seconds)]
+    cmd += ["-i", video_path, "-vn", "-f", "s16le", "-ac", "1", "-ar", str(WHISPER_SAMPLE_RATE), "-"]
+    raw = subprocess.run(cmd, capture_output=True, check=True).stdout
+    return np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+
+
+@lru_cache(maxsize=2)
+def _load_whisper(model_name: str):
+    """Load a Whisper model once per process and name; load errors are not cached."""
+    import whisper  # type: ignore
+    if model_name not in whisper.available_models() and not os.path.isfile(model_name):
+        # Fallback to small only when the requested model does not exist
+        model_name = "small"
+    return whisper.load_model(model_name)
+
+
 def transcribe_audio(video_path: str, max_seconds: Optional[float] = 90.0, model_name: str = "base") -> Dict[str, Any]:
     """
     Transcribe the video's audio locally using OpenAI Whisper (CPU by default).
     Returns: { available: bool, segments: [{startSec, endSec, text}], reason? }
     """
     try:
+        # Load whisper lazily; it pulls in torch
+        try:
+            import whisper  # type: ignore  # noqa: F401
+        except Exception as e:
+            return { 'available': False, 'reason': f'whisper not installed: {e}', 'segments': [] }
         _ensure_ffmpeg_in_path()
-        # Extract an audio subclip to WAV using moviepy (falls back to imageio-ffmpeg binary)
-        from moviepy.editor import VideoFileClip  # type: ignore
-        with VideoFileClip(video_path) as clip:
-            if max_seconds is not None:
-                end = min(max_seconds, clip.duration)
-                if end < clip.duration:
-                    clip = clip.subclip(0, end)
-            with tempfile.TemporaryDirectory() as td:
-                wav_path = os.path.join(td, "audio.wav")
-                # write_audiofile may be noisy; suppress logs
-                clip.audio.write_audiofile(wav_path, verbose=False, logger=None)
-
-                # Load whisper model lazily
-                try:
-                    import whisper  # type: ignore
-                except Exception as e:
-                    return { 'available': False, 'reason': f'whisper not installed: {e}', 'segments': [] }
-
-                try:
-                    model = whisper.load_model(model_name)
-                except Exception:
-                    # Fallback to small if base missing
-                    model = whisper.load_model("small")
-
-                res = model.transcribe(wav_path, language="en")
-                segs: List[Dict[str, Any]] = []
-                for s in res.get('segments', []) or []:
-                    try:
-                        segs.append({
-                            'startSec': float(s.get('start', 0.0)),
-                            'endSec': float(s.get('end', 0.0)),
-                            'text': str(s.get('text', '')).strip()
-                        })
-                    except Exception:
-                        continue
-                return { 'available': True, 'segments': segs }
+        audio = _decode_audio(video_path, max_seconds)
+        model = _load_whisper(model_name)
+        res = model.transcribe(audio, language="en")
+        segs: List[Dict[str, Any]] = []
+        for s in res.get('segments', []) or []:
+            try:
+                segs.append({
+                    'startSec': float(s.get('start', 0.0)),
+                    'endSec': float(s.get('end', 0.0)),
+                    'text': str(s.get('text', '')).strip()
+                })
+            except Exception:
+                continue
+        return { 'available': True, 'segments': segs }
     except Exception as e:
         return { 'available': False, 'reason': str(e), 'segments': [] }
-
@@ -1,6 +1,8 @@
 """Utility helpers for lightweight brand & safety critique heuristics."""
 from __future__ import annotations
 
+import bisect
+import itertools
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -154,7 +156,31 @@ def detect_logo(frames: Sequence[np.ndarray], times: Sequence[float], logo_path:
     )
 
 
-def analyze_text_segments(video_path: str, brand_terms: Sequence[str], run_ocr: bool) -> Dict[str, Any]:
+def _count_term_segments(texts: Sequence[str], terms: Sequence[str]) -> Dict[str, int]:
+    """Count the segments containing each term with one scan of the joined text per term."""
+    counts: Dict[str, int] = {term: 0 for term in terms}
+    if not texts or not counts:
+        return counts
+    joined = "\n".join(texts)
+    # offsets[i] is where segment i + 1 starts in the joined text
+    offsets = list(itertools.accumulate(len(text) + 1 for text in texts))
+    for term in counts:
+        pos = joined.find(term)
+        while pos >= 0:
+            seg_idx = bisect.bisect_right(offsets, pos)
+            counts[term] += 1
+            # A segment counts once per term, so resume at the next segment
+            pos = joined.find(term, offsets[seg_idx])
+    return counts
+
+
+def analyze_text_segments(
+    video_path: str,
+    brand_terms: Sequence[str],
+    run_ocr: bool,
+    frames: Optional[Sequence[np.ndarray]] = None,
+    times: Optional[Sequence[float]] = None,
+) -> Dict[str, Any]:
     if not run_ocr and not brand_terms:
         return {'available': False, 'reason': 'OCR disabled'}
     try:
@@ -162,18 +188,13 @@ def analyze_text_segments(video_path: str, brand_terms: Sequence[str], run_ocr:
     except Exception as exc:  # pragma: no cover - import guard
         return {'available': False, 'reason': f'visual_text unavailable: {exc}'}
 
-    result = extract_visual_text(video_path, fps=1.0, max_frames=90)
+    result = extract_visual_text(video_path, fps=1.0, max_frames=90, frames=frames, times=times)
     if not result.get('available'):
         return {'available': False, 'reason': result.get('reason', 'OCR unavailable')}
 
     segments = result.get('segments') or []
     lower_terms = [term.lower() for term in brand_terms if term]
-    mentions: Dict[str, int] = {term: 0 for term in lower_terms}
-    for seg in segments:
-        text = str(seg.get('text', '')).lower()
-        for term in lower_terms:
-            if term and term in text:
-                mentions[term] += 1
+    mentions = _count_term_segments([str(seg.get('text', '')).lower() for seg in segments], lower_terms)
 
     total_segments = len(segments)
     unique_terms_hit = sum(1 for term, count in mentions.items() if count > 0)
@@ -274,7 +295,10 @@ def evaluate_brand_consistency(
             scores.append(float(score))
 
     text_terms = list(brand_terms or [])
-    text_result = analyze_text_segments(video_path, text_terms, run_ocr=run_ocr or bool(text_terms))
+    # Reuse the frames sampled for the attention pass rather than decoding the video again
+    text_result = analyze_text_segments(
+        video_path, text_terms, run_ocr=run_ocr or bool(text_terms), frames=frames, times=times
+    )
     components['messageClarity'] = text_result
     if isinstance(text_result.get('score'), (int, float)):
         scores.append(float(text_result['score']))
@@ -1,20 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 
-def read_frames(path, fps=2, max_frames=None):
-    cap = cv2.VideoCapture(path)
-    if not cap.isOpened():
-        raise ValueError(f'Cannot open video: {path}')
-    native_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-    step = max(int(native_fps // fps), 1)
+def _open_capture(path, hw_accel=True):
+    # Ask OpenCV (>= 4.5.2) for any available hardware decoder; fall back to software decode
+    accel = getattr(cv2, 'VIDEO_ACCELERATION_ANY', None)
+    if hw_accel and accel is not None and hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+        try:
+            cap = cv2.VideoCapture(path, cv2.CAP_ANY, [cv2.CAP_PROP_HW_ACCELERATION, accel])
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except cv2.error:
+            pass
+    return cv2.VideoCapture(path)
+
+def _read_range(cap, start, stop, step, max_frames=None):
+    """Decode source frames [start, stop) from ``cap``, keeping every ``step``-th index.
 
+    ``stop=None`` reads to EOF. Releases ``cap`` when done.
+    """
+    if start:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start)
     frames, times = [], []
-    idx = 0
-    while True:
-        ret, frame = cap.read()
-        if not ret:
+    idx = start
+    while stop is None or idx < stop:
+        # grab() advances without converting/copying the frame; retrieve() only the sampled ones
+        if not cap.grab():
             break
         if idx % step == 0:
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
             t = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
             frames.append(frame)
             times.append(t)
@@ -22,4 +40,31 @@ def read_frames(path, fps=2, max_frames=None):
                 break
         idx += 1
     cap.release()
+    return frames, times
+
+def read_frames(path, fps=2, max_frames=None, hw_accel=True, workers=1):
+    cap = _open_capture(path, hw_accel=hw_accel)
+    if not cap.isOpened():
+        raise ValueError(f'Cannot open video: {path}')
+    native_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    step = max(int(native_fps // fps), 1)
+    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+
+    if workers > 1 and not max_frames and total > step * workers:
+        # Split the source into contiguous step-aligned ranges; each worker opens its
+        # own capture, seeks to its start and decodes forward (OpenCV releases the GIL).
+        cap.release()
+        chunk = -(-total // workers // step) * step
+        starts = list(range(0, total, chunk))
+        stops = starts[1:] + [None]  # last range reads to EOF in case the count is short
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(
+                lambda bounds: _read_range(_open_capture(path, hw_accel=hw_accel), bounds[0], bounds[1], step),
+                zip(starts, stops),
+            ))
+        frames = [f for part_frames, _ in parts for f in part_frames]
+        times = [t for _, part_times in parts for t in part_times]
+        return frames, times, native_fps
+
+    frames, times = _read_range(cap, 0, None, step, max_frames=max_frames)
     return frames, times, native_fps
@@ -119,7 +119,7 @@ def _draw_scene_change_indicator(frame, frame_idx, deltas, threshold=None):
     return frame
 
 def write_overlay_video(frames_bgr, sal_maps, out_path, fps=24, deltas=None):
-    if not frames_bgr or not sal_maps:
+    if not frames_bgr or len(sal_maps) == 0:
         raise ValueError("Empty frames or saliency maps")
     
     # Optional debug
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 
-def spectral_residual_saliency(frame_bgr):
-    sal = cv2.saliency.StaticSaliencySpectralResidual_create()
+def spectral_residual_saliency(frame_bgr, sal=None):
+    if sal is None:
+        sal = cv2.saliency.StaticSaliencySpectralResidual_create()
     success, saliency_map = sal.computeSaliency(frame_bgr)
     if not success:
         sal2 = cv2.saliency.StaticSaliencyFineGrained_create()
@@ -15,6 +18,27 @@ def spectral_residual_saliency(frame_bgr):
         saliency_map = saliency_map / saliency_map.max()
     return saliency_map
 
+def spectral_residual_saliency_batch(frames_bgr, workers=1, out=None):
+    """Saliency maps for same-sized frames, written into one (N, H, W) float32 array."""
+    if out is None:
+        h, w = frames_bgr[0].shape[:2] if len(frames_bgr) else (0, 0)
+        out = np.empty((len(frames_bgr), h, w), dtype=np.float32)
+    if workers > 1 and len(frames_bgr) > workers:
+        # Contiguous chunks, one detector per thread; each fills its own slice of out
+        # and computeSaliency releases the GIL
+        chunk = -(-len(frames_bgr) // workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(
+                lambda i: spectral_residual_saliency_batch(frames_bgr[i:i + chunk], out=out[i:i + chunk]),
+                range(0, len(frames_bgr), chunk),
+            ))
+        return out
+    # One detector for the whole batch instead of constructing one per frame
+    sal = cv2.saliency.StaticSaliencySpectralResidual_create()
+    for i, f in enumerate(frames_bgr):
+        out[i] = spectral_residual_saliency(f, sal=sal)
+    return out
+
 def heatmap_on_frame(frame_bgr, sal_map, alpha=0.6):
     # Ensure saliency map is 2D and matches frame dimensions
     if len(sal_map.shape) == 3:
@@ -8,9 +8,13 @@ def _hist_feat(frame_bgr):
 
 def _clip_embed(frame_bgr, device='cpu'):
     try:
-        import torch, clip
+        import torch
         from PIL import Image
-        model, preprocess = clip.load('ViT-B/32', device=device, download=True)
+        from .clip_scorer import try_load_clip
+        # Shared process-wide CLIP instance instead of a clip.load per frame
+        model, preprocess, device = try_load_clip(device)
+        if model is None:
+            return None
         img = Image.fromarray(frame_bgr[:,:,::-1])
         inp = preprocess(img).unsqueeze(0).to(device)
         with torch.no_grad():
@@ -1,9 +1,11 @@
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 def _tokenize_words(text: str) -> List[str]:
     return re.findall(r"[A-Za-z']+", text or "")
 
+@lru_cache(maxsize=None)
 def _load_easyocr_reader() -> Optional[object]:
     try:
         import easyocr  # type: ignore
@@ -12,6 +14,7 @@ def _load_easyocr_reader() -> Optional[object]:
     except Exception:
         return None
 
+@lru_cache(maxsize=None)
 def _load_spellchecker():
     try:
         from spellchecker import SpellChecker  # type: ignore
@@ -19,6 +22,7 @@ def _load_spellchecker():
     except Exception:
         return None
 
+@lru_cache(maxsize=None)
 def _load_grammar_tool():
     try:
         import language_tool_python  # type: ignore
@@ -26,9 +30,85 @@ def _load_grammar_tool():
     except Exception:
         return None
 
-def extract_visual_text(video_path: str, fps: float = 1.0, max_frames: int = 90) -> Dict[str, Any]:
+def _ocr_frames(reader: Any, frames: List[Any], batch_size: int) -> List[List[Tuple]]:
+    """
+    Run OCR over RGB frames in chunks of ``batch_size`` so detection and recognition
+    are batched; falls back to per-frame OCR if the batched call is unavailable or fails.
+    """
+    results: List[List[Tuple]] = []
+    step = max(1, int(batch_size))
+    for start in range(0, len(frames), step):
+        chunk = frames[start:start + step]
+        try:
+            # Frames from one video share a shape, so they can be stacked as a batch
+            results.extend(reader.readtext_batched(chunk, batch_size=len(chunk)))
+            continue
+        except Exception:
+            pass
+        for rgb in chunk:
+            try:
+                # each item: [bbox, text, confidence]
+                results.append(reader.readtext(rgb))
+            except Exception:
+                results.append([])
+    return results
+
+def _subsample_frames(frames: Sequence[Any], times: Sequence[float], fps: float) -> Tuple[List[Any], List[float]]:
+    """
+    Thin already-decoded frames down to roughly ``fps`` using their timestamps.
+    """
+    interval = 1.0 / fps if fps and fps > 0 else 0.0
+    kept_frames: List[Any] = []
+    kept_times: List[float] = []
+    next_t: Optional[float] = None
+    for img, t in zip(frames, times):
+        if next_t is None or t >= next_t:
+            kept_frames.append(img)
+            kept_times.append(t)
+            next_t = t + interval
+    return kept_frames, kept_times
+
+def _check_text(text_block: str, spell: Any, tool: Any) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+    """
+    Tokenize one OCR text block and return (words, misspellings, grammar issues).
+    """
+    words = _tokenize_words(text_block)
+    misspel: List[str] = []
+    if spell is not None and words:
+        try:
+            # Use lowercase for spellcheck
+            unknown = spell.unknown([w.lower() for w in words])
+            # Keep original words that match unknown lowercase variants
+            misspel = sorted(set([w for w in words if w.lower() in unknown]))
+        except Exception:
+            misspel = []
+
+    grammar_issues: List[Dict[str, Any]] = []
+    if tool is not None and text_block:
+        try:
+            matches = tool.check(text_block)
+            for m in matches:
+                suggestion = (m.replacements[0] if getattr(m, 'replacements', None) else '')
+                grammar_issues.append({
+                    'message': m.message,
+                    'suggestion': suggestion
+                })
+        except Exception:
+            grammar_issues = []
+    return words, misspel, grammar_issues
+
+def extract_visual_text(
+    video_path: str,
+    fps: float = 1.0,
+    max_frames: int = 90,
+    batch_size: int = 16,
+    frames: Optional[Sequence[Any]] = None,
+    times: Optional[Sequence[float]] = None,
+) -> Dict[str, Any]:
     """
     Extract on-screen text via OCR at a low sampling rate, then run spellcheck and simple grammar checks.
+    OCR runs in batches of ``batch_size`` frames. Pass frames/times already decoded by the caller
+    to reuse them instead of decoding ``video_path`` again.
     Returns a dict with segments and summaries.
     """
     result: Dict[str, Any] = {
@@ -43,8 +123,11 @@ def extract_visual_text(video_path: str, fps: float = 1.0, max_frames: int = 90)
         if reader is None:
             return { 'available': False, 'reason': 'easyocr not installed', 'segments': [] }
 
-        from .frame_extractor import read_frames  # local import
-        frames, times, _ = read_frames(video_path, fps=fps)
+        if frames is not None and times is not None:
+            frames, times = _subsample_frames(frames, times, fps)
+        else:
+            from .frame_extractor import read_frames  # local import
+            frames, times, _ = read_frames(video_path, fps=fps)
         if max_frames and len(frames) > max_frames:
             frames = frames[:max_frames]
             times = times[:max_frames]
@@ -54,22 +137,17 @@ def extract_visual_text(video_path: str, fps: float = 1.0, max_frames: int = 90)
 
         misspell_counts: Dict[str, int] = {}
         grammar_summary: List[Dict[str, Any]] = []
+        checked: Dict[str, Tuple[List[str], List[str], List[Dict[str, Any]]]] = {}
 
-        for img, t in zip(frames, times):
-            # OCR expects RGB; our frames are BGR from cv2
-            try:
-                import cv2  # type: ignore
-                rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            except Exception:
-                rgb = img[:, :, ::-1]
-
-            lines: List[Tuple] = []
-            try:
-                # each item: [bbox, text, confidence]
-                lines = reader.readtext(rgb)
-            except Exception:
-                lines = []
+        # OCR expects RGB; our frames are BGR from cv2
+        try:
+            import cv2  # type: ignore
+            rgb_frames = [cv2.cvtColor(img, cv2.COLOR_BGR2RGB) for img in frames]
+        except Exception:
+            rgb_frames = [img[:, :, ::-1] for img in frames]
+        ocr_lines = _ocr_frames(reader, rgb_frames, batch_size)
 
+        for lines, t in zip(ocr_lines, times):
             combined_texts: List[str] = []
             for item in lines:
                 if len(item) >= 2:
@@ -81,38 +159,19 @@ def extract_visual_text(video_path: str, fps: float = 1.0, max_frames: int = 90)
                 continue
 
             text_block = " ".join(combined_texts)
-            words = _tokenize_words(text_block)
-            misspel: List[str] = []
-            if spell is not None and words:
-                try:
-                    # Use lowercase for spellcheck
-                    unknown = spell.unknown([w.lower() for w in words])
-                    # Keep original words that match unknown lowercase variants
-                    misspel = sorted(set([w for w in words if w.lower() in unknown]))
-                    for w in misspel:
-                        misspell_counts[w.lower()] = misspell_counts.get(w.lower(), 0) + 1
-                except Exception:
-                    misspel = []
-
-            grammar_issues: List[Dict[str, Any]] = []
-            if tool is not None and text_block:
-                try:
-                    matches = tool.check(text_block)
-                    for m in matches:
-                        suggestion = (m.replacements[0] if getattr(m, 'replacements', None) else '')
-                        issue = {
-                            'message': m.message,
-                            'suggestion': suggestion
-                        }
-                        grammar_issues.append(issue)
-                        # Keep a compact summary list
-                        grammar_summary.append({
-                            'time': float(t),
-                            'message': m.message,
-                            'suggestion': suggestion
-                        })
-                except Exception:
-                    grammar_issues = []
+            # On-screen text often persists across frames; check each distinct string once
+            if text_block not in checked:
+                checked[text_block] = _check_text(text_block, spell, tool)
+            words, misspel, grammar_issues = checked[text_block]
+            for w in misspel:
+                misspell_counts[w.lower()] = misspell_counts.get(w.lower(), 0) + 1
+            for issue in grammar_issues:
+                # Keep a compact summary list
+                grammar_summary.append({
+                    'time': float(t),
+                    'message': issue['message'],
+                    'suggestion': issue['suggestion']
+                })
 
             result['segments'].append({
                 'time': float(t),
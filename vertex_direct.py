@@ -1,4 +1,5 @@
 from __future__ import annotations
+import json
 import os
 import re
 import time
@@ -6,10 +7,107 @@ import uuid
 import tempfile
 from typing import Any, Dict, Optional, Tuple
 
+try:  # Optional fast JSON parser; stdlib json is the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - guard for environments without orjson
+    orjson = None  # type: ignore
+
 
 MAX_INLINE_BYTES = 15 * 1024 * 1024  # ~15MB inline limit for Vertex parts
 
 
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _escape_unescaped_inner_quotes(text: str) -> str:
+    """Escape double quotes that appear inside JSON string values."""
+    out: list[str] = []
+    in_string = False
+    escape = False
+    length = len(text)
+    idx = 0
+    while idx < length:
+        ch = text[idx]
+        if in_string:
+            if escape:
+                out.append(ch)
+                escape = False
+            elif ch == '\\':
+                out.append(ch)
+                escape = True
+            elif ch == '"':
+                j = idx + 1
+                while j < length and text[j].isspace():
+                    j += 1
+                next_char = text[j] if j < length else ''
+                if next_char and next_char not in {',', '}', ']', ':'}:
+                    out.append('\\')
+                    out.append('"')
+                else:
+                    out.append(ch)
+                    in_string = False
+            else:
+                out.append(ch)
+        else:
+            out.append(ch)
+            if ch == '"':
+                in_string = True
+        idx += 1
+    return "".join(out)
+
+
+def _repair_json_snippet(candidate: str) -> Optional[Dict[str, Any]]:
+    """Best-effort fixes for common model JSON glitches (index keys, missing commas, truncation)."""
+    candidate = candidate.replace('\r\n', '\n').strip()
+    candidate = re.sub(r'"PartialErrors"\s*:\s*\[[\s\S]*$', '', candidate).rstrip()
+    if candidate.endswith(','):
+        candidate = candidate[:-1].rstrip()
+    candidate = re.sub(r"\n\s*(\d+)\s*:", "\n", candidate)
+    candidate = re.sub(r"}\s*\n\s*{", "},\n{", candidate)
+    candidate = re.sub(r"\]\\s*\\n\\s*{", "],\n{", candidate)
+    candidate = re.sub(r"}\s*\n\s*(\")", r"},\n\1", candidate)
+    candidate = re.sub(r"\]\\s*\\n\\s*(\")", r"],\n\1", candidate)
+    curly_delta = candidate.count('{') - candidate.count('}')
+    if curly_delta > 0:
+        candidate = candidate + ('}' * curly_delta)
+    bracket_delta = candidate.count('[') - candidate.count(']')
+    if bracket_delta > 0:
+        candidate = candidate + (']' * bracket_delta)
+    try:
+        return _json_loads(candidate)
+    except Exception:
+        return None
+
+
+def _extract_json_block(raw_text: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse the outermost {...} block of a model response, repairing it if needed.
+
+    Returns (obj, err); exactly one of them is None.
+    """
+    # JSON-mode responses are usually clean, so skip the slice/escape pass when possible
+    try:
+        parsed = _json_loads(raw_text)
+    except Exception:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed, None
+    start = raw_text.find('{')
+    end = raw_text.rfind('}')
+    if start < 0 or end <= start:
+        return None, "no json braces"
+    snippet = _escape_unescaped_inner_quotes(raw_text[start:end + 1])
+    try:
+        return _json_loads(snippet), None
+    except Exception as pe:
+        repaired = _repair_json_snippet(snippet)
+        if repaired is not None:
+            return repaired, None
+        return None, f"parse error: {pe}"
+
+
 def _init_vertex(project: str, location: str):
     try:
         from vertexai import init as vertex_init  # type: ignore
@@ -32,18 +130,20 @@ def _ensure_ffmpeg_in_path() -> None:
         pass
 
 
-def _compress_for_inline(video_bytes: bytes, content_type: str, max_seconds: float = 60.0) -> bytes:
+def _read_file_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _compress_for_inline(video_path: str, content_type: str, max_seconds: float = 60.0) -> bytes:
     """Compress video to fit under MAX_INLINE_BYTES by trimming and downscaling.
-    Returns new bytes (mp4). If compression fails, returns original bytes.
+    Returns new bytes (mp4). If compression fails, returns the original file bytes.
     """
     try:
         _ensure_ffmpeg_in_path()
         from moviepy.editor import VideoFileClip  # type: ignore
         with tempfile.TemporaryDirectory() as td:
-            in_path = os.path.join(td, "in.mp4")
-            with open(in_path, "wb") as f:
-                f.write(video_bytes)
-            with VideoFileClip(in_path) as clip:
+            with VideoFileClip(video_path) as clip:
                 end = min(max_seconds, clip.duration or max_seconds)
                 sub = clip.subclip(0, end)
                 # Downscale to max width 480, keep aspect
@@ -65,7 +165,7 @@ def _compress_for_inline(video_bytes: bytes, content_type: str, max_seconds: flo
                     verbose=False,
                     logger=None,
                 )
-                data = open(out_path, "rb").read()
+                data = _read_file_bytes(out_path)
                 if len(data) <= MAX_INLINE_BYTES:
                     return data
                 # Try harsher downscale
@@ -84,14 +184,14 @@ def _compress_for_inline(video_bytes: bytes, content_type: str, max_seconds: flo
                     verbose=False,
                     logger=None,
                 )
-                data2 = open(out2, "rb").read()
+                data2 = _read_file_bytes(out2)
                 return data2 if len(data2) < len(data) else data
     except Exception:
-        return video_bytes
+        return _read_file_bytes(video_path)
 
 
 def analyze_brand_vertex(
-    video_bytes: bytes,
+    video_path: str,
     filename: str,
     content_type: str,
     project: str,
@@ -110,7 +210,7 @@ def analyze_brand_vertex(
         model = GenerativeModel("gemini-2.5-flash")
 
         # Always try to compress to keep inline and reduce token usage
-        comp_bytes = _compress_for_inline(video_bytes, content_type or "video/mp4", max_seconds=max_seconds)
+        comp_bytes = _compress_for_inline(video_path, content_type or "video/mp4", max_seconds=max_seconds)
         comp_size = len(comp_bytes)
         used_inline = comp_size <= MAX_INLINE_BYTES
         if len(comp_bytes) > MAX_INLINE_BYTES and not gcs_bucket:
@@ -120,83 +220,13 @@ def analyze_brand_vertex(
             )
 
         # Helper to call model with strict, scoped prompts and return (obj, raw_text, err)
-        import json as pyjson
-
-        def _escape_unescaped_inner_quotes(text: str) -> str:
-            """Escape double quotes that appear inside JSON string values."""
-            out: list[str] = []
-            in_string = False
-            escape = False
-            length = len(text)
-            idx = 0
-            while idx < length:
-                ch = text[idx]
-                if in_string:
-                    if escape:
-                        out.append(ch)
-                        escape = False
-                    elif ch == '\\':
-                        out.append(ch)
-                        escape = True
-                    elif ch == '"':
-                        j = idx + 1
-                        while j < length and text[j].isspace():
-                            j += 1
-                        next_char = text[j] if j < length else ''
-                        if next_char and next_char not in {',', '}', ']', ':'}:
-                            out.append('\\')
-                            out.append('"')
-                        else:
-                            out.append(ch)
-                            in_string = False
-                    else:
-                        out.append(ch)
-                else:
-                    out.append(ch)
-                    if ch == '"':
-                        in_string = True
-                idx += 1
-            return "".join(out)
-
-        def _attempt_json_repair(raw_text: str) -> Optional[Dict[str, Any]]:
-            if not raw_text:
-                return None
-            start = raw_text.find('{')
-            end = raw_text.rfind('}')
-            if start < 0 or end <= start:
-                return None
-            candidate = raw_text[start : end + 1]
-            candidate = _escape_unescaped_inner_quotes(candidate)
-            candidate = candidate.replace('\r\n', '\n').strip()
-            candidate = re.sub(r'"PartialErrors"\s*:\s*\[[\s\S]*$', '', candidate).rstrip()
-            if candidate.endswith(','):
-                candidate = candidate[:-1].rstrip()
-            candidate = re.sub(r"\n\s*(\d+)\s*:", "\n", candidate)
-            candidate = re.sub(r"}\s*\n\s*{", "},\n{", candidate)
-            candidate = re.sub(r"\]\\s*\\n\\s*{", "],\n{", candidate)
-            candidate = re.sub(r"}\s*\n\s*(\")", r"},\n\1", candidate)
-            candidate = re.sub(r"\]\\s*\\n\\s*(\")", r"],\n\1", candidate)
-            curly_delta = candidate.count('{') - candidate.count('}')
-            if curly_delta > 0:
-                candidate = candidate + ('}' * curly_delta)
-            bracket_delta = candidate.count('[') - candidate.count(']')
-            if bracket_delta > 0:
-                candidate = candidate + (']' * bracket_delta)
-            try:
-                return pyjson.loads(candidate)
-            except Exception:
-                return None
-
         def call_json(prompt_text: str, retries: int = 2) -> Tuple[Optional[Dict[str, Any]], str, Optional[str]]:
             current_prompt = prompt_text
             raw_text_cache = ""
             last_err: Optional[str] = None
             for attempt in range(retries + 1):
                 try:
-                    if used_inline:
-                        parts = [Part.from_data(mime_type=content_type or "video/mp4", data=comp_bytes), current_prompt]
-                    else:
-                        parts = [Part.from_data(mime_type=content_type or "video/mp4", data=comp_bytes), current_prompt]
+                    parts = [Part.from_data(mime_type=content_type or "video/mp4", data=comp_bytes), current_prompt]
                     resp_local = model.generate_content(
                         parts,
                         generation_config={
@@ -220,20 +250,9 @@ def analyze_brand_vertex(
                     if not text_concat_l:
                         last_err = "empty text"
                     else:
-                        s = text_concat_l.find("{")
-                        e = text_concat_l.rfind("}")
-                        if s >= 0 and e > s:
-                            snippet = text_concat_l[s:e + 1]
-                            snippet = _escape_unescaped_inner_quotes(snippet)
-                            try:
-                                return pyjson.loads(snippet), text_concat_l, None
-                            except Exception as pe:
-                                repaired_local = _attempt_json_repair(snippet)
-                                if repaired_local is not None:
-                                    return repaired_local, text_concat_l, None
-                                last_err = f"parse error: {pe}"
-                        else:
-                            last_err = "no json braces"
+                        parsed, last_err = _extract_json_block(text_concat_l)
+                        if parsed is not None:
+                            return parsed, text_concat_l, None
                 except Exception as ce:
                     last_err = str(ce)
 
@@ -250,9 +269,6 @@ def analyze_brand_vertex(
                     continue
                 break
 
-            repaired = _attempt_json_repair(raw_text_cache)
-            if repaired is not None:
-                return repaired, raw_text_cache, None
             return None, raw_text_cache, last_err
 
         # Build three scoped prompts to keep responses small and stable